@@ -441,7 +441,8 @@ class _distributedStreamer:
                     leftover_chunk,
                     alignment)
 
-                logger.debug(f"[RunAI Streamer][Distributed] Rank {self.original_group_rank}: Prefilled buffer with {chunk_count_in_batch} chunks and total size {humanize.naturalsize(current_data_size)}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("[RunAI Streamer][Distributed] Rank %s: Prefilled buffer with %s chunks and total size %s", self.original_group_rank, chunk_count_in_batch, humanize.naturalsize(current_data_size))
 
                 # --- Broadcast ---
                 yield from self.broadcast(
@@ -481,6 +482,10 @@ class _distributedStreamer:
         chunk_count_in_batch = 0
         base_ptr = data_buffer.data_ptr()
 
+        # metadata rows are collected on the host and copied to the metadata tensor once per batch,
+        # rather than one small host to device copy per chunk. Row 0 holds the chunk count
+        batch_metadata = [[0, 0, 0, 0]]
+
         while chunk_count_in_batch < max_chunks_per_batch and self.reading_from_storage:
 
             # Prioritize the leftover chunk from the previous batch.
@@ -505,14 +510,13 @@ class _distributedStreamer:
             data_buffer[chunk_offset : chunk_offset + chunk_size].copy_(cpu_buffer.squeeze())
 
             orig_req_idx, orig_chunk_idx, _ = self.rank_dicts_map[ready_request_id][ready_chunk_index]
-            batch_metadata_tensor[chunk_count_in_batch + 1].copy_(
-                torch.tensor([orig_req_idx, orig_chunk_idx, chunk_size, chunk_offset])
-            )
+            batch_metadata.append([orig_req_idx, orig_chunk_idx, chunk_size, chunk_offset])
 
             current_data_size = chunk_offset + chunk_size
             chunk_count_in_batch += 1
 
-        batch_metadata_tensor[0, 0] = chunk_count_in_batch
+        batch_metadata[0][0] = chunk_count_in_batch
+        batch_metadata_tensor[:chunk_count_in_batch + 1].copy_(torch.tensor(batch_metadata, dtype=torch.int64))
 
         return current_data_size, chunk_count_in_batch
 
@@ -533,7 +537,7 @@ class _distributedStreamer:
 
             # self.original_group_rank is the GLOBAL rank of the current process
             if global_broadcasting_rank == self.original_group_rank:
-                logger.debug(f"[RunAI Streamer][Distributed] Rank {self.original_group_rank}: Broadcasting")
+                logger.debug("[RunAI Streamer][Distributed] Rank %s: Broadcasting", self.original_group_rank)
                 chunks_to_read[0] -= chunk_count_in_batch
                 total_broadcast_chunks += chunk_count_in_batch
                 # broadcast metadata
@@ -541,43 +545,44 @@ class _distributedStreamer:
 
                 # broadcast data
                 if chunk_count_in_batch > 0:
-                    logger.debug(f"[RunAI Streamer][Distributed] Rank {self.original_group_rank}: Broadcasting data of size {humanize.naturalsize(current_data_size)}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("[RunAI Streamer][Distributed] Rank %s: Broadcasting data of size %s", self.original_group_rank, humanize.naturalsize(current_data_size))
                     dist.broadcast(data_buffer[:current_data_size], global_broadcasting_rank, group=self.distribution_group)
 
                 # yield
-                    for j in range(chunk_count_in_batch):
-                        meta = batch_metadata_tensor[j + 1]
-                        offset, size = meta[3].item(), meta[2].item()
-                        yield meta[0].item(), meta[1].item(), data_buffer[offset : offset + size]
+                    # read the batch metadata with a single device to host copy,
+                    # each .item() on a device tensor would synchronize separately
+                    for req_idx, chunk_idx, size, offset in batch_metadata_tensor[1 : chunk_count_in_batch + 1].tolist():
+                        yield req_idx, chunk_idx, data_buffer[offset : offset + size]
             else:
                 # receive metadata
-                logger.debug(f"[RunAI Streamer][Distributed] Rank {self.original_group_rank}: Receiving metadata from rank {global_broadcasting_rank}")
+                logger.debug("[RunAI Streamer][Distributed] Rank %s: Receiving metadata from rank %s", self.original_group_rank, global_broadcasting_rank)
                 dist.broadcast(received_metadata_tensor, global_broadcasting_rank, group=self.distribution_group)
 
                 received_chunk_count_in_batch = received_metadata_tensor[0, 0].item()
 
                 if received_chunk_count_in_batch == 0:
-                    logger.debug(f"[RunAI Streamer][Distributed] Rank {self.original_group_rank}: No chunks to receive from rank {global_broadcasting_rank}")
+                    logger.debug("[RunAI Streamer][Distributed] Rank %s: No chunks to receive from rank %s", self.original_group_rank, global_broadcasting_rank)
                     continue
 
                 total_broadcast_chunks += received_chunk_count_in_batch
 
                 # receive data
-                logger.debug(f"[RunAI Streamer][Distributed] Rank {self.original_group_rank}: Receiving data from rank {global_broadcasting_rank}")
-                last_meta = received_metadata_tensor[received_chunk_count_in_batch]
-                total_data_size = last_meta[3].item() + last_meta[2].item() # offset plus size of last chunk in batch
+                logger.debug("[RunAI Streamer][Distributed] Rank %s: Receiving data from rank %s", self.original_group_rank, global_broadcasting_rank)
+                received_metadata = received_metadata_tensor[1 : received_chunk_count_in_batch + 1].tolist()
+                _, _, last_size, last_offset = received_metadata[-1]
+                total_data_size = last_offset + last_size # offset plus size of last chunk in batch
 
                 chunks_to_read[0] -= received_chunk_count_in_batch
 
                 received_data_buf_view = received_buffer[:total_data_size]
 
                 dist.broadcast(received_data_buf_view, global_broadcasting_rank, group=self.distribution_group)
-                logger.debug(f"[RunAI Streamer][Distributed] Rank {self.original_group_rank}: Received data of size {humanize.naturalsize(total_data_size)}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("[RunAI Streamer][Distributed] Rank %s: Received data of size %s", self.original_group_rank, humanize.naturalsize(total_data_size))
 
-                for j in range(received_chunk_count_in_batch):
-                    meta = received_metadata_tensor[j + 1]
-                    offset, size = meta[3].item(), meta[2].item()
-                    yield meta[0].item(), meta[1].item(), received_data_buf_view[offset : offset + size]
+                for req_idx, chunk_idx, size, offset in received_metadata:
+                    yield req_idx, chunk_idx, received_data_buf_view[offset : offset + size]
 
         if total_broadcast_chunks == 0 and chunks_to_read[0] > 0:
             logger.error(f"[RunAI Streamer][Distributed] Error: rank {self.rank} is missing {chunks_to_read[0]} chunks")
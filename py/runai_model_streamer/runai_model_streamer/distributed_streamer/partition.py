@@ -101,11 +101,13 @@ def partition_by_chunks(
 
             current_fc = FileChunks(id=id_generator, path=path, offset=units[0].offset, chunks=[units[0].size])
             current_map = {0: (units[0].original_request_index, units[0].original_chunk_index, units[0].size)}
+            current_end = units[0].offset + units[0].size
             id_generator += 1
             
+            # adjacent units are coalesced into a single range, read with one request
             for i in range(1, len(units)):
                 next_unit = units[i]
-                if current_fc.offset + sum(current_fc.chunks) == next_unit.offset:
+                if current_end == next_unit.offset:
                     new_chunk_index = len(current_fc.chunks)
                     current_fc.chunks.append(next_unit.size)
                     current_map[new_chunk_index] = (next_unit.original_request_index, next_unit.original_chunk_index, next_unit.size)
@@ -114,6 +116,7 @@ def partition_by_chunks(
                     current_fc = FileChunks(id=id_generator, path=path, offset=next_unit.offset, chunks=[next_unit.size])
                     current_map = {0: (next_unit.original_request_index, next_unit.original_chunk_index, next_unit.size)}
                     id_generator += 1
+                current_end = next_unit.offset + next_unit.size
             
             new_partition.append((current_fc, current_map))
         
@@ -204,9 +207,12 @@ def get_total_size_of_partition(partition: List[Tuple[FileChunks, dict]]) -> int
     return sum(sum(fc.chunks) for fc, _ in partition)
 
 def log_partition_info(partitions: List[List[Tuple[FileChunks, dict]]]):
-    log_string = "[RunAI Streamer][Distributed] Partitions sizes:"
-    for i in range(len(partitions)):
-        size = get_total_size_of_partition(partitions[i])
-        log_string += f" {i}: {humanize.naturalsize(size, binary=True)} ; "
+    # summing the partitions walks every chunk, so skip it unless the message is emitted
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    log_string = "[RunAI Streamer][Distributed] Partitions sizes:" + "".join(
+        f" {i}: {humanize.naturalsize(get_total_size_of_partition(partitions[i]), binary=True)} ; "
+        for i in range(len(partitions))
+    )
     logger.debug(log_string)
 
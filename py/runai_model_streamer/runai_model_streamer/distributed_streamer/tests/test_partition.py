@@ -160,6 +160,21 @@ class TestPartitioning(unittest.TestCase):
         self._verify_all_chunks_present(contiguous_requests, partitions)
         self._verify_chunk_maps(contiguous_requests, partitions)
 
+        # Test case 4: Non-contiguous chunks are kept as separate ranges
+        split_requests = [
+            FileChunks(0, path="A", offset=0, chunks=[10, 20]),
+            FileChunks(1, path="A", offset=40, chunks=[5, 5])
+        ]
+        partitions = partition_by_chunks(split_requests, 1)
+        self.assertEqual(len(partitions[0]), 2, "Only contiguous chunks should be merged")
+        self.assertCountEqual(
+            [(fc.offset, fc.chunks) for fc, _ in partitions[0]],
+            [(0, [10, 20]), (40, [5, 5])]
+        )
+
+        self._verify_all_chunks_present(split_requests, partitions)
+        self._verify_chunk_maps(split_requests, partitions)
+
     def test_partition_by_chunks_with_zero_size_chunks(self):
         """Tests that zero-sized chunks are correctly handled (ignored)."""
         requests_with_zero = [
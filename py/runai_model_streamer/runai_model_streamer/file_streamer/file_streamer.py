@@ -53,6 +53,53 @@ def homogeneous_paths(paths: List[str]) -> bool:
             return False
     return True
 
+# Upper bound for each of the two pinned staging buffers - larger chunks are copied in slices,
+# so page-locked host memory stays small regardless of the largest tensor in the model
+_MAX_PINNED_STAGING_SIZE = 32 * 1024 * 1024
+
+class _PinnedDeviceCopier:
+    """
+    Copies chunks to a CUDA device through two pinned staging buffers on a dedicated stream.
+    The host only waits for a staging buffer to be free again, so the DMA of one slice
+    overlaps staging the next one
+    """
+    def __init__(self, device: torch.device, max_chunk_size: int) -> None:
+        self.device = device
+        self.stream = torch.cuda.Stream(device=device)
+        self.buffer_size = max(1, min(max_chunk_size, _MAX_PINNED_STAGING_SIZE))
+        self.staging_buffers = [torch.empty(self.buffer_size, dtype=torch.uint8).pin_memory() for _ in range(2)]
+        self.copy_events = [torch.cuda.Event(), torch.cuda.Event()]
+        self.index = 0
+
+    def copy(self, tensor: torch.Tensor) -> torch.Tensor:
+        source = tensor.view(-1)
+        size = source.numel()
+        with torch.cuda.stream(self.stream):
+            device_tensor = torch.empty(size, dtype=torch.uint8, device=self.device)
+
+        copy_event = None
+        for offset in range(0, size, self.buffer_size):
+            length = min(self.buffer_size, size - offset)
+            staging_buffer = self.staging_buffers[self.index]
+            copy_event = self.copy_events[self.index]
+            self.index = 1 - self.index
+
+            # the copy issued two slices ago may still be reading this staging buffer
+            copy_event.synchronize()
+            staging = staging_buffer[:length]
+            staging.copy_(source[offset:offset + length])
+
+            with torch.cuda.stream(self.stream):
+                device_tensor[offset:offset + length].copy_(staging, non_blocking=True)
+                copy_event.record(self.stream)
+
+        # work queued by the caller on its own stream is ordered after the copy
+        consumer_stream = torch.cuda.current_stream(self.device)
+        if copy_event is not None:
+            consumer_stream.wait_event(copy_event)
+        device_tensor.record_stream(consumer_stream)
+        return device_tensor.view(1, -1)
+
 class FileStreamer:
     def __init__(self) -> None:
         # Initialized here (not only in __enter__) so methods such as list_files
@@ -66,6 +113,8 @@ class FileStreamer:
         self.start_time = timer()
         self.total_size = 0
         self.device_str = None
+        self.target_device = None
+        self.device_copier = None
         self.s3_session = None
         self.s3_credentials = None
         return self
@@ -139,7 +188,18 @@ class FileStreamer:
         if not homogeneous_paths([file_stream_request.path for file_stream_request in file_stream_requests]):
             raise RunaiStreamerInvalidInputException("Cannot stream files from multiple source types in parallel") 
 
+        # resolve the target device once - chunks are read into cpu buffers,
+        # so a cpu (or unset) device means chunks are yielded without a copy
         self.device_str = device
+        self.target_device = None
+        self.device_copier = None
+        if device is not None:
+            torch_device = torch.device(device)
+            if torch_device.type != "cpu":
+                self.target_device = torch_device
+            if torch_device.type == "cuda":
+                max_chunk = max((fc.max_chunk_size() for fc in file_stream_requests if fc.chunks), default=0)
+                self.device_copier = _PinnedDeviceCopier(torch_device, max_chunk)
 
         for file_stream_request in file_stream_requests:
             self.total_size += sum(file_stream_request.chunks)
@@ -204,9 +264,11 @@ class FileStreamer:
             # currently file streamer is always reading a cpu buffer
             # so we don't need to move the tensor to the device
             # for future GDS/CUDA support we will need to move the tensor to the device (cpu or different device)
-            if self.device_str == "cpu":
+            if self.target_device is None:
                 yield file_path, chunk_index, tensor
+            elif self.device_copier is not None:
+                yield file_path, chunk_index, self.device_copier.copy(tensor)
             else:
-                device_tensor = tensor.to(self.device_str)
+                device_tensor = tensor.to(self.target_device)
                 yield file_path, chunk_index, device_tensor
 
@@ -51,11 +51,15 @@ class FilesRequest:
 class FilesRequestsIteratorWithBuffer:
     def __init__(self, buffer_size: int, files_chunks: List[FileChunks]) -> None:
         self.files_requests_iterator = FilesRequestsIterator(buffer_size, files_chunks)
-        logger.debug(
-            f"[RunAI Streamer] CPU Buffer size: {humanize.naturalsize(buffer_size, binary=True)} for files: {[file_chunks.path for file_chunks in files_chunks]}"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "[RunAI Streamer] CPU Buffer size: %s for files: %s",
+                humanize.naturalsize(buffer_size, binary=True),
+                [file_chunks.path for file_chunks in files_chunks],
+            )
         self.buffer = np.empty(buffer_size, dtype=np.uint8)
         self.file_buffers = []
+        self.file_chunk_offsets = []
 
     def get_global_file_and_chunk(self, local_file_index: int, local_chunk_index: int) -> Tuple[str, int, memoryview]:
         file_id, global_chunk_index = self.files_requests_iterator.get_global_file_and_chunk(
@@ -63,10 +67,8 @@ class FilesRequestsIteratorWithBuffer:
         )
         file_buffer = self.file_buffers[local_file_index]
 
-        file_active_chunks = self.files_requests_iterator.active_request.files[local_file_index].chunks
-        chunk_offset_start = sum(file_active_chunks[:local_chunk_index])
-        chunk_offset_end = chunk_offset_start + file_active_chunks[local_chunk_index]
-        return file_id, global_chunk_index, file_buffer[chunk_offset_start: chunk_offset_end]
+        chunk_offsets = self.file_chunk_offsets[local_file_index]
+        return file_id, global_chunk_index, file_buffer[chunk_offsets[local_chunk_index]: chunk_offsets[local_chunk_index + 1]]
 
     def next_request(self) -> Optional[FilesRequest]:
         next_requests = self.files_requests_iterator.next_request()
@@ -74,9 +76,15 @@ class FilesRequestsIteratorWithBuffer:
             return None
 
         self.file_buffers = []
+        # chunk i of a file occupies [offsets[i], offsets[i + 1]) of its buffer, computed once
+        # per request instead of summing the preceding chunks for every ready chunk
+        self.file_chunk_offsets = []
         global_buffer_offset = 0
         for file_request in next_requests.files:
-            chunks_size = sum(file_request.chunks)
+            chunk_offsets = np.zeros(len(file_request.chunks) + 1, dtype=np.int64)
+            np.cumsum(file_request.chunks, out=chunk_offsets[1:])
+            chunks_size = int(chunk_offsets[-1])
+            self.file_chunk_offsets.append(chunk_offsets)
             self.file_buffers.append(self.buffer[global_buffer_offset: global_buffer_offset + chunks_size])
             global_buffer_offset += chunks_size
             
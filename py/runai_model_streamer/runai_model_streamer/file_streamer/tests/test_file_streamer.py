@@ -2,7 +2,9 @@ import unittest
 import tempfile
 import shutil
 import os
-from unittest.mock import patch
+import torch
+from unittest.mock import patch, MagicMock
+import runai_model_streamer.file_streamer.file_streamer as file_streamer
 from runai_model_streamer.file_streamer.file_streamer import FileStreamer
 from runai_model_streamer.file_streamer.requests_iterator import (MemoryCapMode, FileChunks)
 
@@ -92,6 +94,59 @@ class TestBindings(unittest.TestCase):
                     id_to_results[id]["expected_text"],
                 )
 
+    @unittest.skipUnless(torch.cuda.is_available(), "CUDA is not available")
+    def test_stream_to_cuda(self):
+        file_content = "XTest Text1TestText2Test-Text3\n"
+        file_id = 17
+        file_path = os.path.join(self.temp_dir, "cuda_test_file.txt")
+        with open(file_path, "w") as file:
+            file.write(file_content)
+
+        request_sizes = [10, 0, 9, 10]
+        id_to_results = {
+            0: {"expected_text": "Test Text1"},
+            1: {"expected_text": ""},
+            2: {"expected_text": "TestText2"},
+            3: {"expected_text": "Test-Text3"},
+        }
+        with FileStreamer() as fs:
+            fs.stream_files([FileChunks(file_id, file_path, 1, request_sizes)], device="cuda")
+            for res_file_id, id, dst in fs.get_chunks():
+                self.assertEqual(res_file_id, file_id)
+                self.assertEqual(dst.device.type, "cuda")
+                self.assertEqual(
+                    dst.cpu().numpy().tobytes().decode("utf-8"),
+                    id_to_results[id]["expected_text"],
+                )
+
+    # CUDA streams and events are mocked and the copy targets the cpu, so the staging
+    # logic runs without a GPU
+    @patch.object(file_streamer, "_MAX_PINNED_STAGING_SIZE", 4)
+    @patch.object(torch.Tensor, "record_stream", lambda self, stream: None)
+    @patch.object(torch.Tensor, "pin_memory", lambda self: self)
+    @patch("torch.cuda.current_stream")
+    @patch("torch.cuda.stream", MagicMock())
+    @patch("torch.cuda.Event")
+    @patch("torch.cuda.Stream")
+    def test_pinned_copier_slices_large_chunks(self, mock_stream, mock_event, mock_current_stream):
+        copier = file_streamer._PinnedDeviceCopier(torch.device("cpu"), 10)
+        self.assertEqual(copier.buffer_size, 4)
+        self.assertTrue(all(buffer.numel() == 4 for buffer in copier.staging_buffers))
+
+        data = torch.arange(10, dtype=torch.uint8).view(1, -1)
+        self.assertTrue(torch.equal(copier.copy(data), data))
+        self.assertTrue(torch.equal(copier.copy(data[:, :3]), data[:, :3]))
+        self.assertEqual(copier.copy(data[:, :0]).numel(), 0)
+        # three slices for the first chunk and one for the second, alternating buffers
+        self.assertEqual(copier.index, 0)
+
+    @patch.object(torch.Tensor, "pin_memory", lambda self: self)
+    @patch("torch.cuda.Event")
+    @patch("torch.cuda.Stream")
+    def test_pinned_copier_small_chunks(self, mock_stream, mock_event):
+        copier = file_streamer._PinnedDeviceCopier(torch.device("cpu"), 10)
+        self.assertEqual(copier.buffer_size, 10)
+
     def tearDown(self):
         shutil.rmtree(self.temp_dir)
 
@@ -257,6 +257,22 @@ class TestFilesRequestsIteratorWithBuffer(unittest.TestCase):
         self.assertEqual(len(requests_iterator.file_buffers[0]), 4)
         self.assertEqual(len(requests_iterator.file_buffers[1]), 3)
 
+    def test_global_file_and_chunk_buffers(self):
+        requests_iterator = FilesRequestsIteratorWithBuffer.with_memory_cap(
+            MemoryCapMode.largest_chunk, [FileChunks(17, "a.txt", 10, [1, 2, 3, 4]), FileChunks(18, "b.txt", 10, [1, 2, 7, 4])], 5
+        )
+        requests_iterator.buffer[:] = range(len(requests_iterator.buffer))
+
+        requests_iterator.next_request()
+        file_id, chunk_index, chunk_buffer = requests_iterator.get_global_file_and_chunk(0, 2)
+        self.assertEqual((file_id, chunk_index), (17, 2))
+        self.assertEqual(list(chunk_buffer), [3, 4, 5])
+
+        requests_iterator.next_request()
+        file_id, chunk_index, chunk_buffer = requests_iterator.get_global_file_and_chunk(1, 1)
+        self.assertEqual((file_id, chunk_index), (18, 1))
+        self.assertEqual(list(chunk_buffer), [5, 6])
+
     def test_limited_memory_cap_and_smaller_chunks(self):
         requests_iterator = FilesRequestsIteratorWithBuffer.with_memory_cap(
             MemoryCapMode.limited, [FileChunks(17, "a.txt", 10, [1, 2]), FileChunks(18, "b.txt", 10, [3, 4])], 50
@@ -3,6 +3,11 @@ import torch
 import struct
 import json
 from typing import List, Tuple, Optional, Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from runai_model_streamer.distributed_streamer.distributed_streamer import (DistributedStreamer, FileChunks)
 
 SAFETENSORS_DATA_OFFSETS_KEY = "data_offsets"
@@ -58,6 +63,12 @@ def get_safetensors_dtype_map() -> dict:
 
 safetensors_to_torch_dtype = get_safetensors_dtype_map()
 
+# Element sizes are resolved once per dtype, rather than allocating a tensor for every parsed header entry
+safetensors_dtype_element_size = {
+    st_dtype: torch.empty(0, dtype=torch_dtype).element_size()
+    for st_dtype, torch_dtype in safetensors_to_torch_dtype.items()
+}
+
 class SafetensorsMetadata:
     def __init__(self, blob: Any, offset: int) -> None:
         self.offset = offset
@@ -133,9 +144,7 @@ class SafetensorsMetadata:
         try:
             for file_index, ready_chunk_index, buffer in fs.get_chunks():
                 try:
-                    json_bytes = bytearray(buffer.numpy())
-                    json_str = json_bytes.decode('utf-8')
-                    metadatas[file_index] = json.loads(json_str)
+                    metadatas[file_index] = _parse_header(buffer.numpy().tobytes())
                 except UnicodeDecodeError:
                     raise ValueError(f"Corrupted File: Header in {filenames[file_index]} is not valid UTF-8.")
                 except json.JSONDecodeError as e:
@@ -148,27 +157,37 @@ class SafetensorsMetadata:
             metadatas[i], header_sizes[i] + SAFETENSORS_HEADER_BUFFER_SIZE
         ) for i in range(len(filenames))] 
 
+def _parse_header(header: bytes) -> Any:
+    # orjson parses the raw bytes directly, skipping the utf-8 decode into a str;
+    # on failure the stdlib parser runs instead so errors keep their usual types
+    if orjson is not None:
+        try:
+            return orjson.loads(header)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(header.decode('utf-8'))
+
 class SafetensorMetadata:
     def __init__(self, name: str, safetensorMetadata: Any) -> None:
         self.name = name
         self.shape = safetensorMetadata[SAFETENSORS_SHAPE_KEY]
         self.dtype = safetensorMetadata[SAFETENSORS_DTYPE_KEY]
         self.offsets = Offsets(safetensorMetadata[SAFETENSORS_DATA_OFFSETS_KEY])
-        
+
+        # computed once here, as they are read again for every streamed tensor
+        self.item_count = 1
+        for dim in self.shape:
+            self.item_count *= dim
+        self.torch_dtype = self.get_torch_dtype()
+
         self._validate_shape_consistency()
 
     def _validate_shape_consistency(self):
-        # 1. Calculate total number of elements
-        num_elements = 1
-        for dim in self.shape:
-            num_elements *= dim
-        
-        # 2. Identify the actual bytes reserved in the file
+        # 1. Identify the actual bytes reserved in the file
         actual_bytes = self.offsets.get_diff()        
 
-        torch_dtype = self.get_torch_dtype()
-        element_size = torch.tensor([], dtype=torch_dtype).element_size()
-        expected_bytes = num_elements * element_size
+        # 2. Calculate the bytes the shape and dtype require
+        expected_bytes = self.item_count * safetensors_dtype_element_size[self.dtype]
 
         # 3. Final Validation
         if expected_bytes != actual_bytes:
@@ -182,10 +201,7 @@ class SafetensorMetadata:
         return self.offsets.get_diff()
 
     def get_item_count(self) -> int:
-        count = 1
-        for dim in self.shape:
-            count *= dim
-        return count
+        return self.item_count
 
     def get_torch_dtype(self) -> torch.dtype:
         # Handle unknown/unsupported dtypes
@@ -217,10 +233,10 @@ def prepare_request(
 def create_torch_tensor(
     buffer: Any, tensor_metadata: SafetensorMetadata
 ) -> torch.Tensor:
-    if tensor_metadata.get_item_count() == 0:
-        return torch.empty(tensor_metadata.shape, dtype=tensor_metadata.get_torch_dtype())
+    if tensor_metadata.item_count == 0:
+        return torch.empty(tensor_metadata.shape, dtype=tensor_metadata.torch_dtype)
 
-    tensor = buffer.view(tensor_metadata.get_torch_dtype())
+    tensor = buffer.view(tensor_metadata.torch_dtype)
     
     # Reshape the tensor to its final, correct shape.
     return tensor.view(tensor_metadata.shape)
\ No newline at end of file
@@ -5,7 +5,9 @@ import struct
 import json
 import tempfile
 import shutil
+from unittest.mock import patch
 from safetensors import safe_open
+from runai_model_streamer.safetensors_streamer import safetensors_pytorch
 from runai_model_streamer.safetensors_streamer.safetensors_streamer import (
     SafetensorsStreamer,
 )
@@ -114,6 +116,36 @@ class TestSafetensorsStreamer(unittest.TestCase):
             with safe_open(path, framework="pt", device="cpu") as f:
                 pass
 
+    def test_invalid_utf8(self):
+        """Test catching a header that is not valid UTF-8."""
+        bad_header = b'{"test": "\xff\xfe"}'
+        path = self.create_corrupted_safetensors("bad_utf8.st", len(bad_header), bad_header)
+
+        with SafetensorsStreamer() as streamer:
+            with self.assertRaisesRegex(ValueError, "not valid UTF-8"):
+                streamer.stream_file(path, None, "cpu")
+
+    def test_header_parse_without_orjson(self):
+        """Test the stdlib json fallback used when orjson is not installed."""
+        header = json.dumps({"t": {"dtype": "F32", "shape": [2], "data_offsets": [0, 8]}})
+        path = self.create_corrupted_safetensors("valid.st", len(header), header, struct.pack("<2f", 1.0, 2.0))
+        bad_json = '{"test": {"dtype": "F32"'
+        bad_json_path = self.create_corrupted_safetensors("bad_json.st", len(bad_json), bad_json)
+        bad_utf8 = b'{"test": "\xff\xfe"}'
+        bad_utf8_path = self.create_corrupted_safetensors("bad_utf8.st", len(bad_utf8), bad_utf8)
+
+        with patch.object(safetensors_pytorch, "orjson", None):
+            with SafetensorsStreamer() as streamer:
+                streamer.stream_file(path, None, "cpu")
+                tensors = dict(streamer.get_tensors())
+            self.assertTrue(torch.equal(tensors["t"], torch.tensor([1.0, 2.0])))
+
+            with SafetensorsStreamer() as streamer:
+                with self.assertRaisesRegex(ValueError, "not valid JSON"):
+                    streamer.stream_file(bad_json_path, None, "cpu")
+                with self.assertRaisesRegex(ValueError, "not valid UTF-8"):
+                    streamer.stream_file(bad_utf8_path, None, "cpu")
+
     def test_payload_inconsistency_shape_mismatch(self):
         """
         Test logic where Shape * Dtype size != Offset Length.
@@ -32,5 +32,6 @@ setup(
         "s3": [f"runai_model_streamer_s3=={VERSION}"],
         "gcs": [f"runai_model_streamer_gcs=={VERSION}"],
         "azure": [f"runai_model_streamer_azure=={VERSION}"],
+        "orjson": ["orjson"],
     },
 )
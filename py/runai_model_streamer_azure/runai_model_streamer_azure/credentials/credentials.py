@@ -1,10 +1,38 @@
+from __future__ import annotations
 from typing import Optional
+import dataclasses
+import functools
 import os
 
 from azure.identity import DefaultAzureCredential
 from azure.storage.blob import BlobServiceClient
 
 
+DEFAULT_ENDPOINT_SUFFIX = "blob.core.windows.net"
+
+
+@dataclasses.dataclass(frozen=True)
+class AzureEnvConfig:
+    """
+    Azure Blob Storage settings, read from the environment in a single pass.
+    """
+    connection_string: Optional[str] = None
+    account_name: Optional[str] = None
+    account_key: Optional[str] = None
+    sas_token: Optional[str] = None
+    endpoint_suffix: str = DEFAULT_ENDPOINT_SUFFIX
+
+    @staticmethod
+    def from_environ() -> AzureEnvConfig:
+        return AzureEnvConfig(
+            connection_string=os.environ.get("AZURE_STORAGE_CONNECTION_STRING"),
+            account_name=os.environ.get("AZURE_STORAGE_ACCOUNT_NAME"),
+            account_key=os.environ.get("AZURE_STORAGE_ACCOUNT_KEY"),
+            sas_token=os.environ.get("AZURE_STORAGE_SAS_TOKEN"),
+            endpoint_suffix=os.environ.get("AZURE_STORAGE_ENDPOINT_SUFFIX", DEFAULT_ENDPOINT_SUFFIX),
+        )
+
+
 class AzureCredentials:
     """
     Azure Blob Storage credentials configuration.
@@ -15,7 +43,8 @@ class AzureCredentials:
     3. Storage account key: Set AZURE_STORAGE_ACCOUNT_NAME and AZURE_STORAGE_ACCOUNT_KEY
     4. DefaultAzureCredential: Set AZURE_STORAGE_ACCOUNT_NAME (uses Managed Identity, Azure CLI, etc.)
 
-    If values are not provided explicitly, they are loaded from environment variables:
+    If values are not provided explicitly, they are taken from env, which defaults to
+    the following environment variables:
     - AZURE_STORAGE_CONNECTION_STRING
     - AZURE_STORAGE_ACCOUNT_NAME
     - AZURE_STORAGE_ACCOUNT_KEY
@@ -29,15 +58,18 @@ class AzureCredentials:
         sas_token: Optional[str] = None,
         connection_string: Optional[str] = None,
         endpoint_suffix: Optional[str] = None,
-        credential: Optional[DefaultAzureCredential] = None
+        credential: Optional[DefaultAzureCredential] = None,
+        env: Optional[AzureEnvConfig] = None
     ):
-        self.connection_string = connection_string or os.environ.get("AZURE_STORAGE_CONNECTION_STRING")
-        self.account_name = account_name or os.environ.get("AZURE_STORAGE_ACCOUNT_NAME")
-        self.account_key = account_key or os.environ.get("AZURE_STORAGE_ACCOUNT_KEY")
-        self.sas_token = sas_token or os.environ.get("AZURE_STORAGE_SAS_TOKEN")
-        self.endpoint_suffix = endpoint_suffix or os.environ.get("AZURE_STORAGE_ENDPOINT_SUFFIX", "blob.core.windows.net")
+        if env is None:
+            env = AzureEnvConfig.from_environ()
+        self.connection_string = connection_string or env.connection_string
+        self.account_name = account_name or env.account_name
+        self.account_key = account_key or env.account_key
+        self.sas_token = sas_token or env.sas_token
+        self.endpoint_suffix = endpoint_suffix or env.endpoint_suffix
         if credential is None and not self.connection_string and not self.account_key and not self.sas_token:
-            credential = DefaultAzureCredential()
+            credential = _default_azure_credential()
         self.credential = credential
         self._validate()
 
@@ -50,14 +82,29 @@ class AzureCredentials:
             )
 
 
-def get_credentials() -> AzureCredentials:
+@functools.lru_cache(maxsize=1)
+def _default_azure_credential() -> DefaultAzureCredential:
+    """
+    Returns a DefaultAzureCredential shared by the whole process.
+
+    Probing the credential chain and acquiring a token costs several round trips,
+    and the acquired token is cached inside the credential object, so creating a
+    new one per client would repeat that work on every call.
+    """
+    return DefaultAzureCredential()
+
+
+def get_credentials(env: Optional[AzureEnvConfig] = None) -> AzureCredentials:
     """
     Creates Azure credentials from environment variables.
 
+    Args:
+        env: Optional settings already read from the environment, read now if not provided
+
     Returns:
         AzureCredentials object with credentials loaded from environment
         
     Raises:
         ValueError: If neither connection string nor account name is available
     """
-    return AzureCredentials()
+    return AzureCredentials(env=env)
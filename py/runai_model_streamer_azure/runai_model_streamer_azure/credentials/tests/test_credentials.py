@@ -0,0 +1,54 @@
+import os
+import unittest
+from unittest.mock import patch, MagicMock
+
+from runai_model_streamer_azure.credentials.credentials import (
+    AzureCredentials,
+    AzureEnvConfig,
+    DEFAULT_ENDPOINT_SUFFIX,
+    get_credentials,
+)
+
+
+def _env_without_azure_storage():
+    return {k: v for k, v in os.environ.items() if not k.startswith("AZURE_STORAGE_")}
+
+
+class TestAzureEnvConfig(unittest.TestCase):
+    def test_from_environ(self):
+        env = _env_without_azure_storage()
+        env["AZURE_STORAGE_ACCOUNT_NAME"] = "account"
+        env["AZURE_STORAGE_SAS_TOKEN"] = "?sig=token"
+        with patch.dict(os.environ, env, clear=True):
+            config = AzureEnvConfig.from_environ()
+        self.assertEqual(config, AzureEnvConfig(account_name="account", sas_token="?sig=token"))
+        self.assertEqual(config.endpoint_suffix, DEFAULT_ENDPOINT_SUFFIX)
+
+    def test_frozen(self):
+        config = AzureEnvConfig(account_name="account")
+        with self.assertRaises(AttributeError):
+            config.account_name = "other"
+
+
+class TestGetCredentials(unittest.TestCase):
+    def test_env_config_used_instead_of_environ(self):
+        config = AzureEnvConfig(account_name="account", account_key="key", endpoint_suffix="blob.core.chinacloudapi.cn")
+        with patch.dict(os.environ, {"AZURE_STORAGE_ACCOUNT_NAME": "environ-account"}):
+            credentials = get_credentials(config)
+        self.assertEqual(credentials.account_name, "account")
+        self.assertEqual(credentials.account_key, "key")
+        self.assertEqual(credentials.endpoint_suffix, "blob.core.chinacloudapi.cn")
+
+    def test_explicit_values_override_env_config(self):
+        config = AzureEnvConfig(account_name="account", sas_token="token")
+        credentials = AzureCredentials(account_name="explicit", credential=MagicMock(), env=config)
+        self.assertEqual(credentials.account_name, "explicit")
+        self.assertEqual(credentials.sas_token, "token")
+
+    def test_missing_account_raises(self):
+        with self.assertRaises(ValueError):
+            get_credentials(AzureEnvConfig())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,18 +1,55 @@
 from typing import Optional, List, Tuple
-from runai_model_streamer_azure.credentials.credentials import AzureCredentials, get_credentials
+from runai_model_streamer_azure.credentials.credentials import AzureCredentials, AzureEnvConfig, get_credentials
 
 import fnmatch
+import functools
 import os
 import posixpath
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from azure.storage.blob import BlobServiceClient, BlobProperties
+import requests
+from azure.core.pipeline.transport import RequestsTransport
+from azure.identity import DefaultAzureCredential
+from azure.storage.blob import BlobServiceClient, BlobProperties, ContainerClient
 
 
 # Application ID for telemetry (prepended to User-Agent)
 # Reference: https://azure.github.io/azure-sdk/general_azurecore.html#user-agent-format
 _USER_AGENT = "azpartner-runai"
 
+# urllib3 keeps only 10 connections per host by default, too few for parallel blob downloads
+_CONNECTION_POOL_MAXSIZE = 64
+
+# Blobs are downloaded as an initial GET of max_single_get_size followed by ranged GETs
+# of max_chunk_get_size, so a smaller first GET lets the ranges start in parallel sooner
+_MAX_SINGLE_GET_SIZE = 4 * 1024 * 1024
+_MAX_CHUNK_GET_SIZE = 4 * 1024 * 1024
+
+# Number of blobs pull_files downloads at the same time
+_MAX_CONCURRENT_BLOBS = 8
+
+# Parallel ranged GETs per blob (the SDK default is 1); together with
+# _MAX_CONCURRENT_BLOBS this fills the connection pool
+_MAX_CONCURRENCY_PER_BLOB = _CONNECTION_POOL_MAXSIZE // _MAX_CONCURRENT_BLOBS
+
+
+def _create_transport() -> RequestsTransport:
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_maxsize=_CONNECTION_POOL_MAXSIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return RequestsTransport(session=session)
+
+
+def _client_kwargs() -> dict:
+    return {
+        "user_agent": _USER_AGENT,
+        "transport": _create_transport(),
+        "max_single_get_size": _MAX_SINGLE_GET_SIZE,
+        "max_chunk_get_size": _MAX_CHUNK_GET_SIZE,
+    }
+
 
 def _create_client(credentials: Optional[AzureCredentials] = None) -> BlobServiceClient:
     """
@@ -37,7 +74,7 @@ def _create_client(credentials: Optional[AzureCredentials] = None) -> BlobServic
     if credentials.connection_string:
         return BlobServiceClient.from_connection_string(
             credentials.connection_string,
-            user_agent=_USER_AGENT
+            **_client_kwargs()
         )
 
     # Use account name + SAS token if available
@@ -47,7 +84,7 @@ def _create_client(credentials: Optional[AzureCredentials] = None) -> BlobServic
         return BlobServiceClient(
             account_url=account_url,
             credential=token,
-            user_agent=_USER_AGENT
+            **_client_kwargs()
         )
 
     # Use account name + account key if available (StorageSharedKeyCredential)
@@ -56,7 +93,7 @@ def _create_client(credentials: Optional[AzureCredentials] = None) -> BlobServic
         return BlobServiceClient(
             account_url=account_url,
             credential=credentials.account_key,
-            user_agent=_USER_AGENT
+            **_client_kwargs()
         )
 
     # Use account name + DefaultAzureCredential (for production)
@@ -64,10 +101,48 @@ def _create_client(credentials: Optional[AzureCredentials] = None) -> BlobServic
     return BlobServiceClient(
         account_url=account_url,
         credential=credentials.credential,
-        user_agent=_USER_AGENT
+        **_client_kwargs()
     )
 
 
+def _get_client(credentials: Optional[AzureCredentials] = None) -> BlobServiceClient:
+    """
+    Returns a BlobServiceClient shared by all calls with the same credentials,
+    so its HTTP connection pool is reused across glob and pull_files.
+    """
+    if credentials is None:
+        credentials = get_credentials()
+    return _cached_client(
+        credentials.connection_string,
+        credentials.account_name,
+        credentials.account_key,
+        credentials.sas_token,
+        credentials.endpoint_suffix,
+        credentials.credential,
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_client(
+    connection_string: Optional[str],
+    account_name: Optional[str],
+    account_key: Optional[str],
+    sas_token: Optional[str],
+    endpoint_suffix: Optional[str],
+    credential: Optional[DefaultAzureCredential],
+) -> BlobServiceClient:
+    # the values were already resolved, so the environment is not consulted again
+    return _create_client(AzureCredentials(
+        account_name=account_name,
+        account_key=account_key,
+        sas_token=sas_token,
+        connection_string=connection_string,
+        endpoint_suffix=endpoint_suffix,
+        credential=credential,
+        env=AzureEnvConfig(),
+    ))
+
+
 def glob(path: str, allow_pattern: Optional[List[str]] = None, credentials: Optional[AzureCredentials] = None) -> List[str]:
     """
     List files in Azure Blob Storage matching the given pattern.
@@ -80,7 +155,7 @@ def glob(path: str, allow_pattern: Optional[List[str]] = None, credentials: Opti
     Returns:
         List of full Azure blob paths
     """
-    client = _create_client(credentials)
+    client = _get_client(credentials)
 
     if not path.endswith("/"):
         path = f"{path}/"
@@ -107,7 +182,7 @@ def pull_files(
         ignore_pattern: Optional list of glob patterns to exclude
         credentials: Optional AzureCredentials object
     """
-    client = _create_client(credentials)
+    client = _get_client(credentials)
 
     if not model_path.endswith("/"):
         model_path = model_path + "/"
@@ -122,17 +197,26 @@ def pull_files(
 
     container_client = client.get_container_client(container_name)
 
-    for file in files:
-        destination_file = os.path.join(
-            dst,
-            removeprefix(file, base_dir).lstrip("/")
-        )
-        local_dir = Path(destination_file).parent
-        os.makedirs(local_dir, exist_ok=True)
-        
-        blob_client = container_client.get_blob_client(file)
-        with open(destination_file, "wb") as download_file:
-            download_file.write(blob_client.download_blob().readall())
+    with ThreadPoolExecutor(max_workers=_MAX_CONCURRENT_BLOBS) as executor:
+        futures = []
+        for file in files:
+            destination_file = os.path.join(
+                dst,
+                removeprefix(file, base_dir).lstrip("/")
+            )
+            local_dir = Path(destination_file).parent
+            os.makedirs(local_dir, exist_ok=True)
+
+            futures.append(executor.submit(_download_blob, container_client, file, destination_file))
+        for future in futures:
+            future.result()
+
+
+def _download_blob(container_client: ContainerClient, blob_name: str, destination_file: str) -> None:
+    # readinto streams the blob to the file instead of holding all of it in memory
+    blob_client = container_client.get_blob_client(blob_name)
+    with open(destination_file, "wb") as download_file:
+        blob_client.download_blob(max_concurrency=_MAX_CONCURRENCY_PER_BLOB).readinto(download_file)
 
 
 def list_files(
@@ -1,6 +1,10 @@
+import os
+import shutil
+import tempfile
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 import runai_model_streamer_azure.files.files as files
+import runai_model_streamer_azure.credentials.credentials as credentials
 from azure.storage.blob import BlobProperties, BlobServiceClient, ContainerClient
 
 
@@ -107,5 +111,93 @@ class TestListFiles(unittest.TestCase):
         )
         self.assertEqual(result, ["models/weights/config.json", "models/README"])
 
+
+class TestPullFiles(unittest.TestCase):
+    make_blob = TestListFiles.make_blob
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.mock_container_client = MagicMock(spec=ContainerClient)
+        self.mock_blob_client = MagicMock(spec=BlobServiceClient)
+        self.mock_blob_client.get_container_client.return_value = self.mock_container_client
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    @patch("runai_model_streamer_azure.files.files._get_client")
+    def test_pull_files(self, mock_get_client):
+        mock_get_client.return_value = self.mock_blob_client
+        blobs = {f"model/shard-{i}.safetensors": f"content-{i}".encode() for i in range(20)}
+        blobs["model/sub/config.json"] = b"{}"
+        self.mock_container_client.list_blobs.return_value = [
+            self.make_blob(name) for name in blobs
+        ]
+
+        blob_clients = []
+        def get_blob_client(name):
+            blob_client = MagicMock()
+            blob_client.download_blob.return_value.readinto.side_effect = lambda stream: stream.write(blobs[name])
+            blob_clients.append(blob_client)
+            return blob_client
+        self.mock_container_client.get_blob_client.side_effect = get_blob_client
+
+        files.pull_files("az://container/model", self.temp_dir)
+
+        for name, content in blobs.items():
+            with open(os.path.join(self.temp_dir, files.removeprefix(name, "model/")), "rb") as f:
+                self.assertEqual(f.read(), content)
+        for blob_client in blob_clients:
+            blob_client.download_blob.assert_called_once_with(max_concurrency=files._MAX_CONCURRENCY_PER_BLOB)
+
+
+class TestCreateClient(unittest.TestCase):
+    def test_client_uses_pooled_transport(self):
+        client = files._create_client(credentials.AzureCredentials(account_name="account", account_key="a2V5"))
+        transport = client._pipeline._transport
+        while not isinstance(transport, files.RequestsTransport):
+            transport = transport._transport
+        adapter = transport.session.get_adapter("https://account.blob.core.windows.net")
+        self.assertEqual(adapter._pool_maxsize, files._CONNECTION_POOL_MAXSIZE)
+        self.assertEqual(client._config.max_single_get_size, files._MAX_SINGLE_GET_SIZE)
+        self.assertEqual(client._config.max_chunk_get_size, files._MAX_CHUNK_GET_SIZE)
+
+
+class TestClientCache(unittest.TestCase):
+    def setUp(self):
+        files._cached_client.cache_clear()
+        credentials._default_azure_credential.cache_clear()
+
+    def tearDown(self):
+        files._cached_client.cache_clear()
+        credentials._default_azure_credential.cache_clear()
+
+    @patch("runai_model_streamer_azure.files.files._create_client")
+    def test_client_reused(self, mock_create_client):
+        mock_create_client.side_effect = lambda credentials: MagicMock()
+        with patch.dict(os.environ, {"AZURE_STORAGE_CONNECTION_STRING": "UseDevelopmentStorage=true"}):
+            first = files._get_client()
+            second = files._get_client()
+        self.assertIs(first, second)
+        mock_create_client.assert_called_once()
+        self.assertEqual(mock_create_client.call_args.args[0].connection_string, "UseDevelopmentStorage=true")
+
+    @patch("runai_model_streamer_azure.files.files._create_client")
+    def test_client_per_credentials(self, mock_create_client):
+        mock_create_client.side_effect = lambda credentials: MagicMock()
+        first = files._get_client(credentials.AzureCredentials(account_name="account", account_key="key1"))
+        second = files._get_client(credentials.AzureCredentials(account_name="account", account_key="key2"))
+        self.assertIsNot(first, second)
+        self.assertEqual(mock_create_client.call_count, 2)
+
+    @patch("runai_model_streamer_azure.credentials.credentials.DefaultAzureCredential")
+    def test_default_credential_shared(self, mock_default_credential):
+        env = {k: v for k, v in os.environ.items() if not k.startswith("AZURE_STORAGE_")}
+        with patch.dict(os.environ, env, clear=True):
+            first = credentials.AzureCredentials(account_name="account")
+            second = credentials.AzureCredentials(account_name="account")
+        self.assertIs(first.credential, second.credential)
+        mock_default_credential.assert_called_once()
+
+
 if __name__ == "__main__":
     unittest.main()
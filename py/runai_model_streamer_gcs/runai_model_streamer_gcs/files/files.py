@@ -37,14 +37,15 @@ def pull_files(model_path: str,
     if len(files) == 0:
         return
 
-
+    # Bucket handles are built locally; the per-blob download surfaces any
+    # missing-bucket or permission error without a metadata round trip first
+    bucket = gcs.bucket(bucket_name)
     for file in files:
         destination_file = os.path.join(
             dst,
             removeprefix(file, base_dir).lstrip("/"))
         local_dir = Path(destination_file).parent
         os.makedirs(local_dir, exist_ok=True)
-        bucket = gcs.get_bucket(bucket_name)
         blob = bucket.blob(file)
         blob.download_to_filename(destination_file)
 
@@ -65,7 +66,9 @@ def list_files(
         # This ensures a trailing slash without double-slashing
         prefix = posixpath.join(prefix, '')
 
-    bucket = gcs.get_bucket(bucket_name)
+    # No bucket metadata request: list_blobs fails with NotFound/Forbidden
+    # on its own if the bucket is missing or inaccessible
+    bucket = gcs.bucket(bucket_name)
 
     # Use delimiter to control recursion
     # delimiter='/' stops at the next folder level
@@ -1,4 +1,5 @@
 import unittest
+from unittest import mock
 import runai_model_streamer_gcs.files.files as files
 
 
@@ -32,6 +33,18 @@ class TestFiles(unittest.TestCase):
         res = files.removeprefix("test_prefix_string", "test_suffix_")
         self.assertEqual(res, "test_prefix_string")
 
+    def test_list_files_skips_bucket_metadata_request(self):
+        gcs = mock.MagicMock()
+        blob = mock.MagicMock()
+        blob.name = "model/a.safetensors"
+        gcs.bucket.return_value.list_blobs.return_value = [blob]
+
+        res = files.list_files(gcs, "gs://bucket/model", recursive=True)
+
+        self.assertEqual(res, ("bucket", "model/", ["model/a.safetensors"]))
+        gcs.bucket.assert_called_once_with("bucket")
+        gcs.get_bucket.assert_not_called()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,31 +1,118 @@
-from typing import Optional, List, Tuple
-from runai_model_streamer_s3.credentials.credentials import get_credentials, S3Credentials, RUNAI_STREAMER_S3_UNSIGNED_ENV_VAR
+from typing import Optional, List, Tuple, Dict
+from runai_model_streamer_s3.credentials.credentials import (
+    get_credentials,
+    S3Credentials,
+    RUNAI_STREAMER_S3_UNSIGNED_ENV_VAR,
+    RUNAI_STREAMER_NO_BOTO3_SESSION_ENV_VAR,
+)
 import fnmatch
+import functools
 import os
 import boto3
 from botocore import UNSIGNED
 from botocore.config import Config
+from boto3.s3.transfer import TransferConfig
+from s3transfer.manager import TransferManager
+from s3transfer.subscribers import BaseSubscriber
 from pathlib import Path
 import posixpath
 
-
-def _build_client_config() -> Optional[Config]:
-    config_kwargs = {}
-    if os.getenv("RUNAI_STREAMER_S3_USE_VIRTUAL_ADDRESSING", "1") == "0":
+RUNAI_STREAMER_S3_USE_VIRTUAL_ADDRESSING_ENV_VAR = "RUNAI_STREAMER_S3_USE_VIRTUAL_ADDRESSING"
+
+# Variables boto3 reads once, when a client is built. They are part of the client cache key
+# so a rotated session token or a switched endpoint or profile gets a new client
+_AWS_CLIENT_ENV_VARS = (
+    "AWS_ENDPOINT_URL",
+    "AWS_ENDPOINT_URL_S3",
+    "AWS_ACCESS_KEY_ID",
+    "AWS_SECRET_ACCESS_KEY",
+    "AWS_SESSION_TOKEN",
+    "AWS_PROFILE",
+    "AWS_REGION",
+    "AWS_DEFAULT_REGION",
+    "AWS_CA_BUNDLE",
+    "AWS_CONFIG_FILE",
+    "AWS_SHARED_CREDENTIALS_FILE",
+)
+
+# botocore defaults to 10 pooled connections, fewer than the transfer manager's threads
+S3_MAX_POOL_CONNECTIONS = 64
+
+# Objects above the threshold are fetched as concurrent ranged GETs of the chunk size.
+# The transfer threads never outnumber the pooled connections, so they do not wait on each other
+S3_TRANSFER_CONFIG = TransferConfig(
+    max_concurrency=S3_MAX_POOL_CONNECTIONS,
+    multipart_threshold=32 * 1024 * 1024,
+    multipart_chunksize=16 * 1024 * 1024,
+)
+
+
+class _ProvideObjectInfoSubscriber(BaseSubscriber):
+    # The object size and ETag are already known from list_objects_v2. The transfer manager
+    # skips its per-file HeadObject only when both are provided, and the ETag also guards
+    # ranged GETs against the object being overwritten mid-download
+    def __init__(self, size: int, etag: Optional[str]) -> None:
+        self.size = size
+        self.etag = etag
+
+    def on_queued(self, future, **kwargs) -> None:
+        future.meta.provide_transfer_size(self.size)
+        if self.etag is not None:
+            future.meta.provide_object_etag(self.etag)
+
+
+def _build_client_config() -> Config:
+    # tcp_keepalive sets SO_KEEPALIVE on the pooled sockets, so idle connections survive
+    # between requests instead of paying a new TCP and TLS handshake
+    config_kwargs = {
+        "max_pool_connections": S3_MAX_POOL_CONNECTIONS,
+        "tcp_keepalive": True,
+    }
+    if os.getenv(RUNAI_STREAMER_S3_USE_VIRTUAL_ADDRESSING_ENV_VAR, "1") == "0":
         config_kwargs["s3"] = {"addressing_style": "path"}
     if os.getenv(RUNAI_STREAMER_S3_UNSIGNED_ENV_VAR, "0") == "1":
         config_kwargs["signature_version"] = UNSIGNED
-    return Config(**config_kwargs) if config_kwargs else None
+    return Config(**config_kwargs)
 
 def _build_s3_client(credentials: Optional[S3Credentials]):
     session, _ = get_credentials(credentials)
     client_config = _build_client_config()
     if session is None:
-        return boto3.client("s3", config=client_config)
+        # a fresh session rather than boto3's default one, which keeps the credentials it
+        # resolved first - a rebuilt client must pick up rotated AWS_* credentials
+        session = boto3.Session()
     return session.client("s3", config=client_config)
 
+def _get_s3_client(credentials: Optional[S3Credentials]):
+    """
+    Returns an S3 client shared by all calls with the same credentials and configuration,
+    so its connection pool (and the TLS sessions in it) is reused across glob and pull_files
+    """
+    credentials_key = None
+    if credentials is not None:
+        credentials_key = (
+            credentials.access_key_id,
+            credentials.secret_access_key,
+            credentials.session_token,
+            credentials.region_name,
+            credentials.endpoint,
+        )
+    return _cached_s3_client(
+        credentials_key,
+        os.getenv(RUNAI_STREAMER_NO_BOTO3_SESSION_ENV_VAR, "1"),
+        os.getenv(RUNAI_STREAMER_S3_UNSIGNED_ENV_VAR, "0"),
+        os.getenv(RUNAI_STREAMER_S3_USE_VIRTUAL_ADDRESSING_ENV_VAR, "1"),
+        *(os.getenv(name) for name in _AWS_CLIENT_ENV_VARS),
+    )
+
+@functools.lru_cache(maxsize=8)
+def _cached_s3_client(credentials_key: Optional[Tuple[Optional[str], ...]], *env_key: Optional[str]):
+    # the environment values are part of the cache key only, _build_s3_client reads them itself
+    credentials = S3Credentials(*credentials_key) if credentials_key is not None else None
+    return _build_s3_client(credentials)
+
 def glob(path: str, allow_pattern: Optional[List[str]] = None, credentials: Optional[S3Credentials] = None) -> List[str]:
-    s3 = _build_s3_client(credentials)
+    s3 = _get_s3_client(credentials)
     if not path.endswith("/"):
         path = f"{path}/"
     bucket_name, _, keys = list_files(s3,
@@ -38,25 +125,32 @@ def pull_files(model_path: str,
                 allow_pattern: Optional[List[str]] = None,
                 ignore_pattern: Optional[List[str]] = None,
                 credentials: Optional[S3Credentials] = None,) -> None:
-    s3 = _build_s3_client(credentials)
+    s3 = _get_s3_client(credentials)
 
     if not model_path.endswith("/"):
         model_path = model_path + "/"
 
-    bucket_name, base_dir, files = list_files(s3, model_path,
-                                                allow_pattern,
-                                                ignore_pattern,
-                                                recursive = True)
+    bucket_name, base_dir, files = _list_objects(s3, model_path,
+                                                 allow_pattern,
+                                                 ignore_pattern,
+                                                 recursive = True)
     if len(files) == 0:
         return
 
-    for file in files:
-        destination_file = os.path.join(
-            dst,
-            removeprefix(file, base_dir).lstrip("/"))
-        local_dir = Path(destination_file).parent
-        os.makedirs(local_dir, exist_ok=True)
-        s3.download_file(bucket_name, file, destination_file)
+    # all files are queued before waiting, so small files download in parallel
+    # and large ones are split into ranges sharing the same thread pool
+    with TransferManager(s3, S3_TRANSFER_CONFIG) as transfer_manager:
+        futures = []
+        for file, (size, etag) in files.items():
+            destination_file = os.path.join(
+                dst,
+                removeprefix(file, base_dir).lstrip("/"))
+            local_dir = Path(destination_file).parent
+            os.makedirs(local_dir, exist_ok=True)
+            futures.append(transfer_manager.download(bucket_name, file, destination_file,
+                                                     subscribers=[_ProvideObjectInfoSubscriber(size, etag)]))
+        for future in futures:
+            future.result()
 
 def list_files(
         s3,
@@ -65,6 +159,16 @@ def list_files(
         ignore_pattern: Optional[List[str]] = None,
         recursive: bool = False
 ) -> Tuple[str, str, List[str]]:
+    bucket_name, prefix, objects = _list_objects(s3, path, allow_pattern, ignore_pattern, recursive)
+    return bucket_name, prefix, list(objects)
+
+def _list_objects(
+        s3,
+        path: str,
+        allow_pattern: Optional[List[str]] = None,
+        ignore_pattern: Optional[List[str]] = None,
+        recursive: bool = False
+) -> Tuple[str, str, Dict[str, Tuple[int, Optional[str]]]]:
     parts = removeprefix(path, 's3://').split('/')
     bucket_name = parts[0]
     
@@ -86,22 +190,23 @@ def list_files(
         # delimiter='/' so list is not recursive  
         op_parameters['Delimiter'] = '/'
 
-    paths = []
+    # key -> (size, etag), some S3 compatible stores omit the ETag from listings
+    objects = {}
     for page in paginator.paginate(**op_parameters):
         # Contents is a list of files (no folders)
         if 'Contents' in page:
             for obj in page['Contents']:
-                paths.append(obj['Key'])
+                objects[obj['Key']] = (obj['Size'], obj.get('ETag'))
 
     # Filter logic remains the same
-    paths = _filter_ignore(paths, ["*/"])
+    paths = _filter_ignore(list(objects), ["*/"])
     if allow_pattern is not None:
         paths = _filter_allow(paths, allow_pattern)
 
     if ignore_pattern is not None:
         paths = _filter_ignore(paths, ignore_pattern)
 
-    return bucket_name, prefix, paths
+    return bucket_name, prefix, {path: objects[path] for path in paths}
 
 def _filter_allow(paths: List[str], patterns: List[str]) -> List[str]:
     return [
@@ -1,8 +1,14 @@
+import io
 import os
+import shutil
+import tempfile
 import unittest
 from unittest.mock import patch, MagicMock
 
+import boto3
 from botocore import UNSIGNED
+from botocore.response import StreamingBody
+from botocore.stub import Stubber
 
 import runai_model_streamer_s3.files.files as files
 
@@ -94,7 +100,149 @@ class TestBuildS3Client(unittest.TestCase):
         with patch.dict(os.environ, {files.RUNAI_STREAMER_S3_UNSIGNED_ENV_VAR: "1"}):
             files._build_s3_client(None)
         mock_get_credentials.assert_called_once()
-        mock_boto3.client.assert_called_once()
+        mock_boto3.Session.return_value.client.assert_called_once()
+        mock_boto3.client.assert_not_called()
+
+    def test_config_pools_connections(self):
+        config = files._build_client_config()
+        self.assertEqual(config.max_pool_connections, files.S3_MAX_POOL_CONNECTIONS)
+        self.assertTrue(config.tcp_keepalive)
+
+
+class TestGetS3Client(unittest.TestCase):
+    def setUp(self):
+        files._cached_s3_client.cache_clear()
+
+    def tearDown(self):
+        files._cached_s3_client.cache_clear()
+
+    @patch("runai_model_streamer_s3.files.files._build_s3_client")
+    def test_client_reused(self, mock_build_s3_client):
+        mock_build_s3_client.side_effect = lambda credentials: MagicMock()
+        with patch.dict(os.environ, _env_without_unsigned(), clear=True):
+            first = files._get_s3_client(None)
+            second = files._get_s3_client(None)
+        self.assertIs(first, second)
+        mock_build_s3_client.assert_called_once()
+
+    @patch("runai_model_streamer_s3.files.files._build_s3_client")
+    def test_client_per_credentials_and_config(self, mock_build_s3_client):
+        mock_build_s3_client.side_effect = lambda credentials: MagicMock()
+        with patch.dict(os.environ, _env_without_unsigned(), clear=True):
+            default = files._get_s3_client(None)
+            explicit = files._get_s3_client(files.S3Credentials(access_key_id="AKID", secret_access_key="SECRET"))
+            with patch.dict(os.environ, {files.RUNAI_STREAMER_S3_UNSIGNED_ENV_VAR: "1"}):
+                unsigned = files._get_s3_client(None)
+        self.assertIsNot(default, explicit)
+        self.assertIsNot(default, unsigned)
+        self.assertEqual(mock_build_s3_client.call_count, 3)
+        self.assertEqual(mock_build_s3_client.call_args_list[1].args[0].access_key_id, "AKID")
+
+    @patch("runai_model_streamer_s3.files.files._build_s3_client")
+    def test_client_per_aws_environment(self, mock_build_s3_client):
+        mock_build_s3_client.side_effect = lambda credentials: MagicMock()
+        with patch.dict(os.environ, _env_without_unsigned(), clear=True):
+            with patch.dict(os.environ, {"AWS_ENDPOINT_URL": "http://a:9000"}):
+                first = files._get_s3_client(None)
+            with patch.dict(os.environ, {"AWS_ENDPOINT_URL": "http://b:9000"}):
+                second = files._get_s3_client(None)
+            with patch.dict(os.environ, {"AWS_ENDPOINT_URL": "http://b:9000", "AWS_SESSION_TOKEN": "rotated"}):
+                third = files._get_s3_client(None)
+        self.assertIsNot(first, second)
+        self.assertIsNot(second, third)
+        self.assertEqual(mock_build_s3_client.call_count, 3)
+
+    def test_client_picks_up_rotated_credentials(self):
+        env = _env_without_unsigned()
+        env.update({"AWS_ACCESS_KEY_ID": "a", "AWS_SECRET_ACCESS_KEY": "s", "AWS_SESSION_TOKEN": "t1",
+                    "AWS_DEFAULT_REGION": "us-east-1", "AWS_CONFIG_FILE": os.devnull,
+                    "AWS_SHARED_CREDENTIALS_FILE": os.devnull})
+        with patch.dict(os.environ, env, clear=True):
+            first = files._get_s3_client(None)
+            with patch.dict(os.environ, {"AWS_ACCESS_KEY_ID": "b", "AWS_SESSION_TOKEN": "t2"}):
+                second = files._get_s3_client(None)
+        first_credentials = first._get_credentials().get_frozen_credentials()
+        second_credentials = second._get_credentials().get_frozen_credentials()
+        self.assertEqual((first_credentials.access_key, first_credentials.token), ("a", "t1"))
+        self.assertEqual((second_credentials.access_key, second_credentials.token), ("b", "t2"))
+
+
+class TestPullFiles(unittest.TestCase):
+    def setUp(self):
+        self.s3 = MagicMock()
+        self.s3.get_paginator.return_value.paginate.return_value = [
+            {"Contents": [
+                {"Key": "model/config.json", "Size": 10, "ETag": '"etag-config"'},
+                {"Key": "model/dir/", "Size": 0, "ETag": '"etag-dir"'},
+                {"Key": "model/weights.safetensors", "Size": 1024, "ETag": '"etag-weights"'},
+            ]}
+        ]
+
+    def test_list_objects(self):
+        bucket_name, prefix, objects = files._list_objects(
+            self.s3, "s3://bucket/model/", allow_pattern=["*.safetensors"], recursive=True
+        )
+        self.assertEqual(bucket_name, "bucket")
+        self.assertEqual(prefix, "model/")
+        self.assertEqual(objects, {"model/weights.safetensors": (1024, '"etag-weights"')})
+
+    @patch("runai_model_streamer_s3.files.files._get_s3_client")
+    def test_pull_files_skips_head_object(self, mock_get_s3_client):
+        # a real client and transfer manager, with only the listing and GetObject stubbed:
+        # any other request (such as HeadObject) fails the stubber
+        s3 = boto3.client("s3", region_name="us-east-1",
+                          aws_access_key_id="AKID", aws_secret_access_key="SECRET")
+        operations = []
+        s3.meta.events.register("provide-client-params.s3", lambda model, **kwargs: operations.append(model.name))
+        content = b"weights"
+        with Stubber(s3) as stubber:
+            stubber.add_response("list_objects_v2", {"Contents": [
+                {"Key": "model/weights.safetensors", "Size": len(content), "ETag": '"etag-weights"'},
+            ]})
+            stubber.add_response("get_object", {
+                "Body": StreamingBody(io.BytesIO(content), len(content)),
+                "ContentLength": len(content),
+                "ETag": '"etag-weights"',
+            })
+            mock_get_s3_client.return_value = s3
+            dst = tempfile.mkdtemp()
+            try:
+                files.pull_files("s3://bucket/model", dst)
+                with open(os.path.join(dst, "weights.safetensors"), "rb") as f:
+                    self.assertEqual(f.read(), content)
+            finally:
+                shutil.rmtree(dst)
+            stubber.assert_no_pending_responses()
+        self.assertEqual(operations, ["ListObjectsV2", "GetObject"])
+
+    def test_subscriber_provides_size_and_etag(self):
+        future = MagicMock()
+        files._ProvideObjectInfoSubscriber(1024, '"etag"').on_queued(future)
+        future.meta.provide_transfer_size.assert_called_once_with(1024)
+        future.meta.provide_object_etag.assert_called_once_with('"etag"')
+
+        future = MagicMock()
+        files._ProvideObjectInfoSubscriber(1024, None).on_queued(future)
+        future.meta.provide_object_etag.assert_not_called()
+
+    @patch("runai_model_streamer_s3.files.files.TransferManager")
+    @patch("runai_model_streamer_s3.files.files._get_s3_client")
+    def test_pull_files_queues_all_downloads_before_waiting(self, mock_get_s3_client, mock_transfer_manager):
+        mock_get_s3_client.return_value = self.s3
+        manager = mock_transfer_manager.return_value.__enter__.return_value
+        events = []
+        def download(*args, **kwargs):
+            events.append("download")
+            future = MagicMock()
+            future.result.side_effect = lambda: events.append("result")
+            return future
+        manager.download.side_effect = download
+        with patch("os.makedirs"):
+            files.pull_files("s3://bucket/model", "/tmp/dst")
+
+        self.assertEqual(events, ["download", "download", "result", "result"])
+        mock_transfer_manager.assert_called_once_with(self.s3, files.S3_TRANSFER_CONFIG)
+        self.assertLessEqual(files.S3_TRANSFER_CONFIG.max_request_concurrency, files.S3_MAX_POOL_CONNECTIONS)
 
 
 if __name__ == "__main__":